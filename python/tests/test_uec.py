@@ -1,4 +1,6 @@
 import unittest
+from collections import OrderedDict
+from enum import IntEnum
 
 from uec import (
     assert_uec,
@@ -23,6 +25,25 @@ class TestUEC(unittest.TestCase):
         self.assertFalse(result.ok)
         self.assertGreater(len(result.errors), 0)
 
+    def test_is_uec_matches_validate_uec(self) -> None:
+        card = create_character_uec({"id": "char-6", "name": "Aster Vale"})
+        self.assertFalse(is_uec(card, strict=True))
+        self.assertFalse(is_uec({**card, "extensions": []}))
+        self.assertFalse(is_uec("not a card"))
+        self.assertTrue(is_uec(card))
+
+    def test_accepts_builtin_subclasses(self) -> None:
+        class Stamp(IntEnum):
+            CREATED = 1715100000
+
+        card = create_character_uec({"id": "char-7", "name": "Aster Vale"})
+        card["meta"] = {"createdAt": Stamp.CREATED, "authors": ["Aster"]}
+        ordered = OrderedDict(card)
+        ordered["payload"] = OrderedDict(card["payload"])
+
+        self.assertEqual(validate_uec(ordered).errors, [])
+        self.assertTrue(is_uec(ordered))
+
     def test_app_specific_settings_must_be_object(self) -> None:
         card = create_persona_uec(
             {"id": "per-1", "title": "Pragmatic Analyst"},
@@ -1,3 +1,5 @@
+import json
+import math
 import unittest
 
 from uec import (
@@ -17,11 +19,14 @@ from uec import (
     normalize_uec,
     parse_uec,
     rewrite_assets,
+    stringify_uec,
     upgrade_uec,
     validate_uec,
     validate_uec_at_version,
+    validate_uec_many,
     validate_uec_strict,
 )
+from uec._codegen import STRING, check, compile_validator, strict_check
 from uec.types import MergeOptions
 
 
@@ -76,11 +81,64 @@ class TestUECV2AndTools(unittest.TestCase):
         self.assertNotIn("scenes", v2["payload"])
         self.assertNotIn("scene", v2["payload"])
 
+    def test_convert_skip_validation_accepts_prevalidated_cards(self) -> None:
+        v1 = {
+            "schema": {"name": "UEC", "version": "1.0"},
+            "kind": "character",
+            "payload": {"id": "cv-skip", "scenes": []},
+        }
+
+        with self.assertRaises(ValueError):
+            convert_uec_v1_to_v2(v1)
+
+        v2 = convert_uec_v1_to_v2(v1, skip_validation=True)
+        self.assertEqual(v2["schema"]["version"], SCHEMA_VERSION_V2)
+        self.assertNotIn("scenes", v2["payload"])
+
+        upgraded = upgrade_uec(v1, skip_validation=True)
+        self.assertEqual(upgraded, v2)
+
     def test_parse_rejects_invalid_json(self) -> None:
         result = parse_uec("{ not-valid-json")
         self.assertFalse(result.ok)
         self.assertTrue(any("invalid JSON" in e for e in result.errors))
 
+    def test_stringify_and_parse_match_stdlib_json(self) -> None:
+        card = create_character_uec_v2(
+            {"id": "floats", "name": "Floats"},
+            extensions={
+                "big": 1e20,
+                "small": 1e-7,
+                "long": 1.2345678901234568e17,
+                "text": "héllo",
+            },
+        )
+
+        text = stringify_uec(card)
+        self.assertEqual(text, json.dumps(normalize_uec(card), indent=2, sort_keys=True))
+        self.assertIn("1e+20", text)
+        self.assertIn("1e-07", text)
+
+        parsed = parse_uec(text)
+        self.assertTrue(parsed.ok)
+        self.assertEqual(parsed.value, json.loads(text))
+
+        card["extensions"]["snowflake"] = 123456789012345678901234567890
+        card["extensions"]["below_int64"] = -9223372036854775809
+        text = stringify_uec(card)
+        parsed = parse_uec(text)
+        self.assertTrue(parsed.ok)
+        self.assertEqual(parsed.value, json.loads(text))
+        self.assertEqual(
+            parsed.value["extensions"]["snowflake"], 123456789012345678901234567890
+        )
+        self.assertEqual(parsed.value["extensions"]["below_int64"], -9223372036854775809)
+
+        card["extensions"]["nan"] = float("nan")
+        text = stringify_uec(card)
+        self.assertIn('"nan": NaN', text)
+        self.assertTrue(math.isnan(parse_uec(text).value["extensions"]["nan"]))
+
     def test_normalize_fills_top_level_optional_objects(self) -> None:
         raw = {
             "schema": {"name": "UEC", "version": "1.0"},
@@ -92,12 +150,52 @@ class TestUECV2AndTools(unittest.TestCase):
         self.assertIn("meta", normalized)
         self.assertIn("extensions", normalized)
 
+    def test_normalize_handles_deeply_nested_extensions(self) -> None:
+        nested = {"b": 1, "a": []}
+        for _ in range(5000):
+            nested = {"z": [nested], "a": None}
+        card = create_persona_uec({"id": "p2", "title": "Deep"}, extensions={"deep": nested})
+        normalized = normalize_uec(card)
+        self.assertEqual(list(normalized["extensions"]["deep"]), ["a", "z"])
+        self.assertIsNot(normalized["extensions"]["deep"], nested)
+
     def test_validate_at_version_reports_mismatch(self) -> None:
         card = create_character_uec_v2({"id": "ver", "name": "Versioned"})
         result = validate_uec_at_version(card, "1.0")
         self.assertFalse(result.ok)
         self.assertTrue(any("expected \"1.0\"" in e for e in result.errors))
 
+    def test_validate_many_matches_single_validation(self) -> None:
+        cards = [
+            create_character_uec_v2({"id": "many-1", "name": "First"}),
+            create_persona_uec({"id": "many-2"}),
+            "not a card",
+        ]
+
+        results = validate_uec_many(iter(cards), strict=True)
+        expected = [validate_uec(card, strict=True) for card in cards]
+        self.assertEqual(results, expected)
+        self.assertEqual([r.ok for r in results], [False, False, False])
+        self.assertEqual(validate_uec_many(cards[:1]), [validate_uec(cards[0])])
+
+    def test_compiled_validator_binds_strict_only_fields_outside_strict_block(self) -> None:
+        validate = compile_validator(
+            "_validate_sample",
+            "payload",
+            (
+                strict_check("name", STRING, "is required in strict mode"),
+                check("name", "v is None or " + STRING, "must be a string"),
+            ),
+        )
+
+        errors: list = []
+        validate({"name": 1}, errors, False)
+        self.assertEqual(errors, ["payload.name: must be a string"])
+
+        errors = []
+        validate({}, errors, True)
+        self.assertEqual(errors, ["payload.name: is required in strict mode"])
+
     def test_merge_supports_base_conflict_strategy(self) -> None:
         base = {"a": 1, "nested": {"x": "base"}}
         incoming = {"a": 2, "nested": {"x": "incoming"}}
@@ -118,6 +216,38 @@ class TestUECV2AndTools(unittest.TestCase):
         self.assertIn(("added", "added"), paths)
         self.assertIn(("gone", "removed"), paths)
 
+    def test_diff_orders_entries_on_deep_and_large_cards(self) -> None:
+        def build(leaf: str, count: int) -> dict:
+            nested = {"leaf": leaf}
+            for _ in range(5000):
+                nested = {"z": [nested], "a": None}
+            entries = [{"content": f"entry-{i}", "keys": [str(i)]} for i in range(count)]
+            return create_character_uec_v2(
+                {"id": "deep", "name": "Deep", "characterBook": {"entries": entries}},
+                extensions={"deep": nested},
+            )
+
+        left = build("before", 300)
+        right = build("after", 301)
+        right["payload"]["characterBook"]["entries"][7]["content"] = "changed"
+        right["payload"]["characterBook"]["entries"][120]["keys"] = ["120", "extra"]
+        right["payload"]["nickname"] = "Deeper"
+
+        diff = diff_uec(left, right)
+
+        deep_path = "extensions.deep" + ".z[0]" * 5000 + ".leaf"
+        self.assertEqual(
+            [(item.path, item.change_type) for item in diff],
+            [
+                (deep_path, "changed"),
+                ("payload.characterBook.entries[7].content", "changed"),
+                ("payload.characterBook.entries[120].keys[1]", "changed"),
+                ("payload.characterBook.entries[300]", "changed"),
+                ("payload.nickname", "added"),
+            ],
+        )
+        self.assertEqual(diff_uec(left, build("before", 300)), [])
+
     def test_asset_helpers_extract_and_rewrite(self) -> None:
         card = {
             "schema": {"name": "UEC", "version": "2.0"},
@@ -156,6 +286,21 @@ class TestUECV2AndTools(unittest.TestCase):
         self.assertIn("cdn.example.com", rewritten["payload"]["avatar"])
         self.assertIn("cdn.example.com", rewritten["payload"]["chatBackground"]["url"])
 
+    def test_rewrite_assets_copies_only_changed_branches(self) -> None:
+        card = create_character_uec_v2(
+            {"id": "cow", "name": "Copy", "avatar": "https://example.com/a.png"},
+            meta={"authors": ["a"]},
+        )
+
+        unchanged = rewrite_assets(card, lambda asset: asset.value)
+        self.assertIs(unchanged, card)
+
+        rewritten = rewrite_assets(card, lambda asset: "asset://avatar")
+        self.assertEqual(rewritten["payload"]["avatar"], "asset://avatar")
+        self.assertEqual(card["payload"]["avatar"], "https://example.com/a.png")
+        self.assertIsNot(rewritten["payload"], card["payload"])
+        self.assertIs(rewritten["meta"], card["meta"])
+
     def test_lint_reports_quality_warnings(self) -> None:
         card = {
             "schema": {"name": "UEC", "version": "2.0"},
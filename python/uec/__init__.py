@@ -37,6 +37,7 @@ from .validators import (
     is_uec,
     validate_uec,
     validate_uec_at_version,
+    validate_uec_many,
 )
 
 __all__ = [
@@ -59,6 +60,7 @@ __all__ = [
     "convert_uec_v1_to_v2",
     "validate_uec",
     "validate_uec_at_version",
+    "validate_uec_many",
     "validate_uec_strict",
     "is_uec",
     "is_character_uec",
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, NamedTuple, Sequence, Union
+
+from .utils import is_number, is_string_list
+
+STRING = "isinstance(v, str)"
+OPTIONAL_STRING = "v is None or isinstance(v, str)"
+NUMBER = "is_number(v)"
+OPTIONAL_NUMBER = "v is None or is_number(v)"
+OPTIONAL_BOOLEAN = "v is None or isinstance(v, bool)"
+OBJECT = "isinstance(v, dict)"
+OPTIONAL_OBJECT = "v is None or isinstance(v, dict)"
+ARRAY = "isinstance(v, list)"
+OPTIONAL_STRING_LIST = "v is None or is_string_list(v)"
+ABSENT = "v is None"
+
+
+class FieldCheck(NamedTuple):
+    key: str
+    predicate: str
+    message: str
+    strict_only: bool = False
+
+
+class FieldCall(NamedTuple):
+    key: str
+    function: Callable[..., None]
+    args: str
+    skip_none: bool = False
+
+
+FieldSpec = Union[FieldCheck, FieldCall]
+
+
+def check(key: str, predicate: str, message: str) -> FieldCheck:
+    return FieldCheck(key, predicate, message)
+
+
+def strict_check(key: str, predicate: str, message: str) -> FieldCheck:
+    return FieldCheck(key, predicate, message, strict_only=True)
+
+
+def call(
+    key: str, function: Callable[..., None], args: str, skip_none: bool = False
+) -> FieldCall:
+    return FieldCall(key, function, args, skip_none)
+
+
+def compile_validator(
+    name: str, prefix: str, fields: Sequence[FieldSpec]
+) -> Callable[[Dict[str, Any], List[str], bool], None]:
+    scope: Dict[str, Any] = {"is_number": is_number, "is_string_list": is_string_list}
+    lines = [f"def {name}(obj, errors, strict):", "    append = errors.append"]
+    in_strict_block = False
+    local_names: Dict[str, str] = {}
+    non_strict_keys = {
+        field.key
+        for field in fields
+        if not (isinstance(field, FieldCheck) and field.strict_only)
+    }
+
+    for field in fields:
+        path = f"{prefix}.{field.key}"
+        strict_only = isinstance(field, FieldCheck) and field.strict_only
+        local_name = local_names.get(field.key)
+        binding = f"v = {local_name}"
+        if local_name is None:
+            local_name = local_names[field.key] = f"v{len(local_names)}"
+            binding = f"v = {local_name} = obj.get({field.key!r})"
+            if strict_only and field.key in non_strict_keys:
+                # Bind outside the strict block so later non-strict specs can reuse it.
+                lines.append(f"    {local_name} = obj.get({field.key!r})")
+                binding = f"v = {local_name}"
+                in_strict_block = False
+
+        if strict_only and not in_strict_block:
+            lines.append("    if strict:")
+        in_strict_block = strict_only
+        indent = "        " if strict_only else "    "
+        lines.append(f"{indent}{binding}")
+        if isinstance(field, FieldCheck):
+            lines.append(f"{indent}if not ({field.predicate}):")
+            lines.append(f"{indent}    append({f'{path}: {field.message}'!r})")
+            continue
+
+        function_name = field.function.__name__
+        scope[function_name] = field.function
+        args = field.args.format(path=repr(path))
+        if field.skip_none:
+            lines.append(f"{indent}if v is not None:")
+            lines.append(f"{indent}    {function_name}(v, {args})")
+        else:
+            lines.append(f"{indent}{function_name}(v, {args})")
+
+    exec("\n".join(lines), scope)  # noqa: S102
+    return scope[name]
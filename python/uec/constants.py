@@ -2,3 +2,5 @@ SCHEMA_NAME = "UEC"
 SCHEMA_VERSION = "1.0"
 SCHEMA_VERSION_V2 = "2.0"
 KNOWN_VERSIONS = {SCHEMA_VERSION, SCHEMA_VERSION_V2}
+KNOWN_KINDS = frozenset(("character", "persona"))
+ASSET_LOCATOR_TYPES = frozenset(("inline_base64", "remote_url", "asset_ref"))
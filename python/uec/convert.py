@@ -7,13 +7,14 @@ from .utils import is_number, is_plain_object, is_string
 from .validators import validate_uec
 
 
-def convert_uec_v1_to_v2(card: Dict[str, Any]) -> Dict[str, Any]:
+def convert_uec_v1_to_v2(card: Dict[str, Any], *, skip_validation: bool = False) -> Dict[str, Any]:
     if not is_plain_object(card):
         raise ValueError("card must be an object")
 
-    validation = validate_uec(card)
-    if not validation.ok:
-        raise ValueError(f"card must be a valid v1 UEC: {'; '.join(validation.errors)}")
+    if not skip_validation:
+        validation = validate_uec(card)
+        if not validation.ok:
+            raise ValueError(f"card must be a valid v1 UEC: {'; '.join(validation.errors)}")
 
     schema = card.get("schema")
     schema_version = schema.get("version") if isinstance(schema, dict) else None
@@ -5,6 +5,9 @@ from typing import Any, Dict, Optional
 from .constants import SCHEMA_NAME, SCHEMA_VERSION, SCHEMA_VERSION_V2
 from .utils import is_plain_object
 
+_DEFAULT_SCHEMA = {"name": SCHEMA_NAME, "version": SCHEMA_VERSION}
+_DEFAULT_SCHEMA_V2 = {"name": SCHEMA_NAME, "version": SCHEMA_VERSION_V2}
+
 
 def _normalize_system_prompt(payload: Dict[str, Any], system_prompt_is_id: bool) -> Dict[str, Any]:
     if not system_prompt_is_id:
@@ -37,14 +40,12 @@ def create_uec(
     if not is_plain_object(payload):
         raise ValueError("payload must be an object")
 
-    schema = schema or {}
-    is_v2 = schema.get("version") == SCHEMA_VERSION_V2
-
-    base_schema = {
-        "name": SCHEMA_NAME,
-        "version": SCHEMA_VERSION_V2 if is_v2 else SCHEMA_VERSION,
-    }
-    base_schema.update(schema)
+    if schema:
+        is_v2 = schema.get("version") == SCHEMA_VERSION_V2
+        base_schema = {**(_DEFAULT_SCHEMA_V2 if is_v2 else _DEFAULT_SCHEMA), **schema}
+    else:
+        is_v2 = False
+        base_schema = dict(_DEFAULT_SCHEMA)
 
     normalized_payload = (
         _normalize_system_prompt(payload, system_prompt_is_id)
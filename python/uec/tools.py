@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Callable, Dict, List, Optional, Set
+from itertools import groupby, zip_longest
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .constants import SCHEMA_VERSION, SCHEMA_VERSION_V2
 from .convert import convert_uec_v1_to_v2
@@ -15,9 +16,9 @@ from .types import (
     ParseValidationResult,
 )
 from .utils import (
+    NUMBER_TYPES,
     is_asset_locator_object,
     is_likely_asset_string,
-    is_number,
     is_plain_object,
     is_string,
     normalize_value,
@@ -70,6 +71,18 @@ def stringify_uec(card: Dict[str, Any], indent: int = 2) -> str:
     return json.dumps(normalize_uec(card), indent=indent, sort_keys=True)
 
 
+_V1_REMOVED_FIELDS = (
+    "fallbackModelId",
+    "nickname",
+    "creator",
+    "creatorNotes",
+    "creatorNotesMultilingual",
+    "source",
+    "characterBook",
+)
+_V1_REMOVED_FIELD_SET = frozenset(_V1_REMOVED_FIELDS)
+
+
 def downgrade_uec(
     card: Dict[str, Any], target_version: str = SCHEMA_VERSION, keep_rules: bool = False
 ) -> DowngradeResult:
@@ -84,13 +97,7 @@ def downgrade_uec(
         raise ValueError(f"unsupported source version: {version}")
 
     warnings: List[str] = []
-    next_card = dict(card)
-
-    schema = dict(next_card.get("schema", {}))
-    schema["version"] = SCHEMA_VERSION
-    next_card["schema"] = schema
-
-    payload = dict(next_card.get("payload", {}))
+    payload = {**(card.get("payload") or {})}
 
     scene = payload.pop("scene", None)
     if is_plain_object(scene):
@@ -110,27 +117,16 @@ def downgrade_uec(
             "payload.promptTemplateId was mapped to v1 systemPrompt and then removed"
         )
 
-    removed_fields = [
-        "fallbackModelId",
-        "nickname",
-        "creator",
-        "creatorNotes",
-        "creatorNotesMultilingual",
-        "source",
-        "characterBook",
-    ]
-
-    for field in removed_fields:
-        if field in payload:
-            payload.pop(field, None)
-            warnings.append(f"payload.{field} is not supported in v1 and was removed")
+    if not payload.keys().isdisjoint(_V1_REMOVED_FIELD_SET):
+        for field in _V1_REMOVED_FIELDS:
+            if field in payload:
+                payload.pop(field, None)
+                warnings.append(f"payload.{field} is not supported in v1 and was removed")
 
     if not keep_rules and "rules" not in payload:
         payload["rules"] = []
 
-    next_card["payload"] = payload
-
-    meta = dict(next_card.get("meta", {}))
+    meta = {**(card.get("meta") or {})}
     if meta.pop("originalCreatedAt", None) is not None:
         warnings.append("meta.originalCreatedAt was removed for v1 compatibility")
     if meta.pop("originalUpdatedAt", None) is not None:
@@ -138,19 +134,29 @@ def downgrade_uec(
     if meta.pop("originalSource", None) is not None:
         warnings.append("meta.originalSource was removed for v1 compatibility")
 
-    next_card["meta"] = meta
+    next_card = {
+        **card,
+        "schema": {**card["schema"], "version": SCHEMA_VERSION},
+        "payload": payload,
+        "meta": meta,
+    }
 
     return DowngradeResult(card=next_card, warnings=warnings)
 
 
-def upgrade_uec(card: Dict[str, Any], target_version: str = SCHEMA_VERSION_V2) -> Dict[str, Any]:
+def upgrade_uec(
+    card: Dict[str, Any],
+    target_version: str = SCHEMA_VERSION_V2,
+    *,
+    skip_validation: bool = False,
+) -> Dict[str, Any]:
     version = card.get("schema", {}).get("version")
 
     if target_version == SCHEMA_VERSION_V2:
         if version == SCHEMA_VERSION_V2:
             return normalize_uec(card)
         if version == SCHEMA_VERSION:
-            return convert_uec_v1_to_v2(card)
+            return convert_uec_v1_to_v2(card, skip_validation=skip_validation)
         raise ValueError(f"unsupported source version: {version}")
 
     if target_version == SCHEMA_VERSION:
@@ -167,86 +173,163 @@ def _deep_equal(a: Any, b: Any) -> bool:
     if isinstance(a, list):
         return len(a) == len(b) and all(_deep_equal(x, y) for x, y in zip(a, b))
     if isinstance(a, dict):
-        return set(a.keys()) == set(b.keys()) and all(
+        return len(a) == len(b) and a.keys() == b.keys() and all(
             _deep_equal(a[k], b[k]) for k in a.keys()
         )
     return a == b
 
 
-def _walk_diff(a: Any, b: Any, path: str, out: List[DiffEntry]) -> None:
-    if _deep_equal(a, b):
-        return
+_PathParts = Optional[Tuple[Any, Any, bool]]
 
-    if isinstance(a, list) and isinstance(b, list):
-        for idx in range(max(len(a), len(b))):
-            av = a[idx] if idx < len(a) else None
-            bv = b[idx] if idx < len(b) else None
-            _walk_diff(av, bv, f"{path}[{idx}]", out)
-        return
 
-    if isinstance(a, dict) and isinstance(b, dict):
-        keys = sorted(set(a.keys()) | set(b.keys()))
-        for key in keys:
-            next_path = f"{path}.{key}" if path else key
-            if key not in a:
-                out.append(DiffEntry(path=next_path, change_type="added", after=b[key]))
-            elif key not in b:
-                out.append(DiffEntry(path=next_path, change_type="removed", before=a[key]))
-            else:
-                _walk_diff(a[key], b[key], next_path, out)
+def _format_path(parts: _PathParts) -> str:
+    segments: List[Tuple[Any, bool]] = []
+    while parts is not None:
+        parts, segment, is_index = parts
+        segments.append((segment, is_index))
+
+    path = ""
+    for segment, is_index in reversed(segments):
+        if is_index:
+            path = f"{path}[{segment}]"
+        else:
+            path = f"{path}.{segment}" if path else segment
+    return path
+
+
+_MISSING = object()
+
+
+def _walk_diff(left: Any, right: Any, out: List[DiffEntry]) -> None:
+    # Both sides come from normalize_uec, so every container is a plain dict or list.
+    if not (type(left) is type(right) and type(left) in (dict, list)):
+        if left is not right and not (type(left) is type(right) and left == right):
+            out.append(DiffEntry(path="root", change_type="changed", before=left, after=right))
         return
 
-    out.append(DiffEntry(path=path or "root", change_type="changed", before=a, after=b))
+    stack: List[Any] = [(left, right, None)]
+    while stack:
+        frame = stack.pop()
+        if type(frame) is DiffEntry:
+            out.append(frame)
+            continue
+
+        a, b, parts = frame
+        children: Iterator[Tuple[Any, Any, Any]]
+        if type(a) is list:
+            children = zip_longest(range(max(len(a), len(b))), a, b)
+            is_index = True
+        elif a.keys() == b.keys():
+            if parts is not None:
+                # normalize_value inserts keys in sorted order, so equal key sets line up.
+                children = zip(a, a.values(), b.values())
+            else:
+                # normalize_uec may append missing top-level objects after the sorted keys.
+                keys = sorted(a)
+                children = zip(keys, map(a.__getitem__, keys), map(b.__getitem__, keys))
+            is_index = False
+        else:
+            keys = sorted(a.keys() | b.keys())
+            a_get = a.get
+            b_get = b.get
+            children = ((key, a_get(key, _MISSING), b_get(key, _MISSING)) for key in keys)
+            is_index = False
+
+        pending: List[Any] = []
+        descends = False
+        for key, av, bv in children:
+            if av is bv:
+                continue
+            child_type = type(av)
+            if child_type is type(bv) and (child_type is dict or child_type is list):
+                pending.append((av, bv, (parts, key, is_index)))
+                descends = True
+            elif av is _MISSING:
+                pending.append(
+                    DiffEntry(
+                        path=_format_path((parts, key, is_index)), change_type="added", after=bv
+                    )
+                )
+            elif bv is _MISSING:
+                pending.append(
+                    DiffEntry(
+                        path=_format_path((parts, key, is_index)), change_type="removed", before=av
+                    )
+                )
+            elif not (child_type is type(bv) and av == bv):
+                pending.append(
+                    DiffEntry(
+                        path=_format_path((parts, key, is_index)) or "root",
+                        change_type="changed",
+                        before=av,
+                        after=bv,
+                    )
+                )
+
+        if descends:
+            stack.extend(reversed(pending))
+        else:
+            out.extend(pending)
 
 
 def diff_uec(left: Dict[str, Any], right: Dict[str, Any]) -> List[DiffEntry]:
     out: List[DiffEntry] = []
-    _walk_diff(normalize_uec(left), normalize_uec(right), "", out)
+    if left is right:
+        return out
+    _walk_diff(normalize_uec(left), normalize_uec(right), out)
     return out
 
 
-def _merge_values(
-    base: Any,
-    incoming: Any,
-    path: str,
-    options: MergeOptions,
-    conflicts: Set[str],
-) -> Any:
-    if incoming is None:
-        return base
-
-    if base is None:
-        return incoming
-
-    if isinstance(base, list) and isinstance(incoming, list):
-        if options.array == "concat":
-            return [*base, *incoming]
-        if not _deep_equal(base, incoming):
-            conflicts.add(path or "root")
-        return incoming
-
-    if isinstance(base, dict) and isinstance(incoming, dict):
-        out: Dict[str, Any] = {}
-        for key in set(base.keys()) | set(incoming.keys()):
-            next_path = f"{path}.{key}" if path else key
-            out[key] = _merge_values(
-                base.get(key), incoming.get(key), next_path, options, conflicts
-            )
-        return out
+_Merger = Callable[[Any, Any, _PathParts, List[str]], Any]
+
+
+def _build_merger(concat_arrays: bool, keep_base: bool) -> _Merger:
+    def merge(base: Any, incoming: Any, parts: _PathParts, conflicts: List[str]) -> Any:
+        if incoming is None:
+            return base
+
+        if base is None:
+            return incoming
+
+        if isinstance(base, list) and isinstance(incoming, list):
+            if concat_arrays:
+                return [*base, *incoming]
+            if not _deep_equal(base, incoming):
+                conflicts.append(_format_path(parts) or "root")
+            return incoming
+
+        if isinstance(base, dict) and isinstance(incoming, dict):
+            out: Dict[str, Any] = {}
+            for key in base.keys() | incoming.keys():
+                out[key] = merge(base.get(key), incoming.get(key), (parts, key, False), conflicts)
+            return out
+
+        if base is not incoming and not (type(base) is type(incoming) and base == incoming):
+            conflicts.append(_format_path(parts) or "root")
+
+        return base if keep_base else incoming
+
+    return merge
+
 
-    if not _deep_equal(base, incoming):
-        conflicts.add(path or "root")
+_MERGERS: Dict[Tuple[bool, bool], _Merger] = {
+    (concat_arrays, keep_base): _build_merger(concat_arrays, keep_base)
+    for concat_arrays in (False, True)
+    for keep_base in (False, True)
+}
 
-    return base if options.conflict == "base" else incoming
+
+def _get_merger(options: MergeOptions) -> _Merger:
+    return _MERGERS[(options.array == "concat", options.conflict == "base")]
 
 
 def merge_uec(
     base: Dict[str, Any], incoming: Dict[str, Any], options: Optional[MergeOptions] = None
 ) -> MergeResult:
-    options = options or MergeOptions()
-    conflicts: Set[str] = set()
-    value = _merge_values(base, incoming, "", options, conflicts)
-    return MergeResult(value=value, conflicts=sorted(conflicts))
+    merge = _get_merger(options or MergeOptions())
+    conflicts: List[str] = []
+    value = merge(base, incoming, None, conflicts)
+    return MergeResult(value=value, conflicts=[path for path, _ in groupby(sorted(conflicts))])
 
 
 def validate_uec_strict(value: Any):
@@ -257,53 +340,74 @@ def validate_uec_at_version(value: Any, version: str, strict: bool = False):
     return _validate_uec_at_version(value, version, strict)
 
 
-def extract_assets(card: Dict[str, Any]) -> List[AssetReference]:
-    assets: List[AssetReference] = []
+def _walk_assets(
+    value: Any, parts: _PathParts, visit: Callable[[_PathParts, str, Any], None]
+) -> None:
+    if is_likely_asset_string(value):
+        visit(parts, "string", value)
+        return
 
-    def walk(value: Any, path: str) -> None:
-        if is_likely_asset_string(value):
-            assets.append(AssetReference(path=path, kind="string", value=value))
-            return
+    if is_asset_locator_object(value):
+        visit(parts, "locator", value)
+        return
 
-        if is_asset_locator_object(value):
-            assets.append(AssetReference(path=path, kind="locator", value=value))
-            return
+    if isinstance(value, list):
+        for idx, item in enumerate(value):
+            _walk_assets(item, (parts, idx, True), visit)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _walk_assets(item, (parts, key, False), visit)
 
-        if isinstance(value, list):
-            for idx, item in enumerate(value):
-                walk(item, f"{path}[{idx}]")
-            return
 
-        if isinstance(value, dict):
-            for key, item in value.items():
-                next_path = f"{path}.{key}" if path else key
-                walk(item, next_path)
+def extract_assets(card: Dict[str, Any]) -> List[AssetReference]:
+    assets: List[AssetReference] = []
 
-    walk(card, "")
+    def visit(parts: _PathParts, kind: str, value: Any) -> None:
+        assets.append(AssetReference(path=_format_path(parts), kind=kind, value=value))
+
+    _walk_assets(card, None, visit)
     return assets
 
 
 def rewrite_assets(card: Dict[str, Any], mapper: Callable[[AssetReference], Any]) -> Dict[str, Any]:
-    def walk(value: Any, path: str) -> Any:
+    def walk(value: Any, parts: _PathParts) -> Tuple[Any, bool]:
         if is_likely_asset_string(value):
-            return mapper(AssetReference(path=path, kind="string", value=value))
+            mapped = mapper(AssetReference(path=_format_path(parts), kind="string", value=value))
+            return mapped, mapped is not value
 
         if is_asset_locator_object(value):
-            return mapper(AssetReference(path=path, kind="locator", value=value))
+            mapped = mapper(AssetReference(path=_format_path(parts), kind="locator", value=value))
+            return mapped, mapped is not value
 
         if isinstance(value, list):
-            return [walk(item, f"{path}[{idx}]") for idx, item in enumerate(value)]
+            items: Optional[List[Any]] = None
+            for idx, item in enumerate(value):
+                next_item, changed = walk(item, (parts, idx, True))
+                if changed and items is None:
+                    items = value[:idx]
+                if items is not None:
+                    items.append(next_item)
+            return (value, False) if items is None else (items, True)
 
         if isinstance(value, dict):
-            out: Dict[str, Any] = {}
+            out: Optional[Dict[str, Any]] = None
             for key, item in value.items():
-                next_path = f"{path}.{key}" if path else key
-                out[key] = walk(item, next_path)
-            return out
+                next_item, changed = walk(item, (parts, key, False))
+                if changed:
+                    if out is None:
+                        out = dict(value)
+                    out[key] = next_item
+            return (value, False) if out is None else (out, True)
+
+        return value, False
 
-        return value
+    return walk(card, None)[0]
 
-    return walk(card, "")
+
+def _is_real_number(value: Any) -> bool:
+    return type(value) in NUMBER_TYPES or (
+        isinstance(value, NUMBER_TYPES) and not isinstance(value, bool)
+    )
 
 
 def lint_uec(card: Dict[str, Any]) -> LintResult:
@@ -324,26 +428,22 @@ def lint_uec(card: Dict[str, Any]) -> LintResult:
     payload_created_at = payload.get("createdAt")
     payload_updated_at = payload.get("updatedAt")
     if (
-        isinstance(payload_created_at, (int, float))
-        and not isinstance(payload_created_at, bool)
-        and isinstance(payload_updated_at, (int, float))
-        and not isinstance(payload_updated_at, bool)
+        _is_real_number(payload_created_at)
+        and _is_real_number(payload_updated_at)
+        and payload_created_at > payload_updated_at
     ):
-        if payload_created_at > payload_updated_at:
-            warnings.append("payload.createdAt is greater than payload.updatedAt")
+        warnings.append("payload.createdAt is greater than payload.updatedAt")
 
     meta_raw = card.get("meta")
     if isinstance(meta_raw, dict):
         meta_created_at = meta_raw.get("createdAt")
         meta_updated_at = meta_raw.get("updatedAt")
         if (
-            isinstance(meta_created_at, (int, float))
-            and not isinstance(meta_created_at, bool)
-            and isinstance(meta_updated_at, (int, float))
-            and not isinstance(meta_updated_at, bool)
+            _is_real_number(meta_created_at)
+            and _is_real_number(meta_updated_at)
+            and meta_created_at > meta_updated_at
         ):
-            if meta_created_at > meta_updated_at:
-                warnings.append("meta.createdAt is greater than meta.updatedAt")
+            warnings.append("meta.createdAt is greater than meta.updatedAt")
 
     scene = payload.get("scene")
     schema = card.get("schema")
@@ -355,22 +455,19 @@ def lint_uec(card: Dict[str, Any]) -> LintResult:
         and isinstance(scene.get("variants"), list)
     ):
         selected_variant = scene.get("selectedVariant")
-        ids = {
-            variant.get("id")
+        if not any(
+            is_plain_object(variant) and variant.get("id") == selected_variant
             for variant in scene["variants"]
-            if is_plain_object(variant) and is_string(variant.get("id"))
-        }
-        if selected_variant not in ids:
+        ):
             warnings.append("payload.scene.selectedVariant does not match any variant id")
 
-    for asset in extract_assets(card):
-        if (
-            asset.kind == "locator"
-            and is_plain_object(asset.value)
-            and asset.value.get("type") == "inline_base64"
-            and is_string(asset.value.get("data"))
-            and len(asset.value["data"]) > 200000
-        ):
-            warnings.append(f"{asset.path}: inline_base64 asset is very large")
+    def visit(parts: _PathParts, kind: str, value: Any) -> None:
+        if kind != "locator" or value.get("type") != "inline_base64":
+            return
+        data = value.get("data")
+        if is_string(data) and len(data) > 200000:
+            warnings.append(f"{_format_path(parts)}: inline_base64 asset is very large")
+
+    _walk_assets(card, None, visit)
 
-    return LintResult(ok=len(warnings) == 0, warnings=warnings)
+    return LintResult(ok=not warnings, warnings=warnings)
@@ -1,29 +1,32 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class ValidationResult:
     ok: bool
     errors: List[str]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParseValidationResult:
     ok: bool
     value: Optional[Dict[str, Any]]
     errors: List[str]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DowngradeResult:
     card: Dict[str, Any]
     warnings: List[str]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DiffEntry:
     path: str
     change_type: str
@@ -31,26 +34,26 @@ class DiffEntry:
     after: Any = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class MergeOptions:
     array: str = "replace"
     conflict: str = "incoming"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MergeResult:
     value: Any
     conflicts: List[str]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AssetReference:
     path: str
     kind: str
     value: Any
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LintResult:
     ok: bool
     warnings: List[str]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from math import isfinite
-from typing import Any, Dict, List
+from typing import Any, List
 
-from .constants import KNOWN_VERSIONS
+from .constants import ASSET_LOCATOR_TYPES, KNOWN_VERSIONS
 
 
 def is_plain_object(value: Any) -> bool:
@@ -14,10 +14,18 @@ def is_string(value: Any) -> bool:
     return isinstance(value, str)
 
 
+NUMBER_TYPES = (int, float)
+_INF = float("inf")
+_NINF = -_INF
+
+
 def is_number(value: Any) -> bool:
-    if isinstance(value, bool):
-        return False
-    if not isinstance(value, (int, float)):
+    value_type = type(value)
+    if value_type is int:
+        return True
+    if value_type is float:
+        return value == value and value != _INF and value != _NINF
+    if value_type is bool or not isinstance(value, NUMBER_TYPES):
         return False
     return isfinite(value)
 
@@ -38,6 +46,15 @@ def optional_boolean(value: Any) -> bool:
     return value is None or is_boolean(value)
 
 
+def is_string_list(value: Any) -> bool:
+    if not isinstance(value, list):
+        return False
+    for item in value:
+        if not isinstance(item, str):
+            return False
+    return True
+
+
 def optional_string_list(value: Any) -> bool:
     if value is None:
         return True
@@ -56,28 +73,51 @@ def push_error(errors: List[str], path: str, message: str) -> None:
     errors.append(f"{path}: {message}")
 
 
-def normalize_value(value: Any) -> Any:
+_LEAF_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _empty_like(value: Any) -> Any:
     if isinstance(value, list):
-        return [normalize_value(item) for item in value]
-    if not is_plain_object(value):
+        return []
+    if isinstance(value, dict):
+        return {}
+    return None
+
+
+def normalize_value(value: Any) -> Any:
+    root = _empty_like(value)
+    if root is None:
         return value
 
-    out: Dict[str, Any] = {}
-    for key in sorted(value.keys()):
-        item = value[key]
-        if item is not None:
-            out[key] = normalize_value(item)
+    stack = [(value, root)]
+    while stack:
+        source, out = stack.pop()
+        if type(out) is dict:
+            for key in sorted(source):
+                item = source[key]
+                if type(item) not in _LEAF_TYPES:
+                    copied = _empty_like(item)
+                    if copied is not None:
+                        stack.append((item, copied))
+                        item = copied
+                out[key] = item
         else:
-            out[key] = None
-    return out
+            append = out.append
+            for item in source:
+                if type(item) not in _LEAF_TYPES:
+                    copied = _empty_like(item)
+                    if copied is not None:
+                        stack.append((item, copied))
+                        item = copied
+                append(item)
+
+    return root
 
 
 def is_asset_locator_object(value: Any) -> bool:
-    return is_plain_object(value) and value.get("type") in {
-        "inline_base64",
-        "remote_url",
-        "asset_ref",
-    }
+    if not isinstance(value, dict):
+        return False
+    return value.get("type") in ASSET_LOCATOR_TYPES
 
 
 def is_likely_asset_string(value: Any) -> bool: